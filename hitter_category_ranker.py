@@ -8,13 +8,20 @@ The same z-score engine is reused for:
 
 from __future__ import annotations
 
+import functools
 import json
+import warnings
 from pathlib import Path
 from typing import Any, Iterable, Mapping, Sequence
 
 import numpy as np
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to the stdlib json module.
+    orjson = None
+
 BATTER_CATEGORIES: tuple[str, ...] = (
     "R",
     "H",
@@ -62,10 +69,21 @@ COMBINED_NEGATIVE_CATEGORIES: frozenset[str] = frozenset(
     }
 )
 
+BATTER_Z_COLUMNS: tuple[str, ...] = tuple(f"z_{category}" for category in BATTER_CATEGORIES)
+PITCHER_Z_COLUMNS: tuple[str, ...] = tuple(f"z_{category}" for category in PITCHER_CATEGORIES)
+COMBINED_Z_COLUMNS: tuple[str, ...] = tuple(f"z_{category}" for category in COMBINED_CATEGORIES)
+
+_Z_COLUMNS_BY_CATEGORIES: dict[tuple[str, ...], tuple[str, ...]] = {
+    BATTER_CATEGORIES: BATTER_Z_COLUMNS,
+    PITCHER_CATEGORIES: PITCHER_Z_COLUMNS,
+    COMBINED_CATEGORIES: COMBINED_Z_COLUMNS,
+}
+
 # Backward-compatible aliases for batter-only callers.
 CATEGORIES: tuple[str, ...] = BATTER_CATEGORIES
 NEGATIVE_CATEGORIES: frozenset[str] = BATTER_NEGATIVE_CATEGORIES
 WEIGHTS: dict[str, float] = {category: 1.0 for category in CATEGORIES}
+Z_COLUMNS: tuple[str, ...] = BATTER_Z_COLUMNS
 
 
 def default_weights_for_categories(categories: Sequence[str]) -> dict[str, float]:
@@ -73,6 +91,15 @@ def default_weights_for_categories(categories: Sequence[str]) -> dict[str, float
     return {category: 1.0 for category in categories}
 
 
+def _z_score_columns(categories: Sequence[str]) -> list[str]:
+    """Return z-score column names for the categories, reusing the precomputed modes."""
+    category_key = tuple(categories)
+    z_columns = _Z_COLUMNS_BY_CATEGORIES.get(category_key)
+    if z_columns is None:
+        z_columns = tuple(f"z_{category}" for category in category_key)
+    return list(z_columns)
+
+
 def get_mode_profile(mode: str) -> dict[str, Any]:
     """Return categories and negative categories for a supported mode."""
     normalized_mode = str(mode or "batters").strip().lower()
@@ -95,11 +122,49 @@ def get_mode_profile(mode: str) -> dict[str, Any]:
     }
 
 
-def load_players_from_json(json_path: str | Path) -> list[dict[str, Any]]:
-    """Load player records from a JSON file."""
+def read_json_payload(json_path: str | Path) -> Any:
+    """Parse a JSON file, using orjson when it is installed."""
     path = Path(json_path)
+    if orjson is not None:
+        raw = path.read_bytes()
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity literals older stdlib-written files may contain.
+            return json.loads(raw)
     with path.open("r", encoding="utf-8") as file:
-        payload = json.load(file)
+        return json.load(file)
+
+
+def write_json_records(records: Sequence[Mapping[str, Any]], json_path: str | Path) -> None:
+    """Write records as indented JSON (NaN and inf as null), using orjson when it is installed."""
+    path = Path(json_path)
+    if orjson is not None:
+        # orjson writes NaN and inf as null and serializes NumPy scalars natively.
+        payload = [dict(record) for record in records]
+        path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        return
+
+    json_ready: list[dict[str, Any]] = []
+    for record in records:
+        cleaned_record: dict[str, Any] = {}
+        for key, value in record.items():
+            if isinstance(value, (float, np.floating)) and not np.isfinite(value):
+                cleaned_record[key] = None
+            elif isinstance(value, np.floating):
+                cleaned_record[key] = float(value)
+            elif isinstance(value, np.integer):
+                cleaned_record[key] = int(value)
+            else:
+                cleaned_record[key] = value
+        json_ready.append(cleaned_record)
+
+    path.write_text(json.dumps(json_ready, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+def load_players_from_json(json_path: str | Path) -> list[dict[str, Any]]:
+    """Load player records from a JSON file."""
+    payload = read_json_payload(json_path)
 
     if not isinstance(payload, list):
         raise ValueError("Expected JSON payload to be a list of player records.")
@@ -120,17 +185,19 @@ def _coerce_player_dataframe(
     if not player_records:
         raise ValueError("No player records were provided.")
 
-    df = pd.DataFrame(player_records).copy()
+    df = pd.DataFrame(player_records)
 
     if "name" not in df.columns:
         raise ValueError("Each player record must include a 'name' field.")
 
     df["name"] = df["name"].fillna("Unknown Player").astype(str)
 
-    for category in categories:
-        if category not in df.columns:
-            df[category] = np.nan
-        df[category] = pd.to_numeric(df[category], errors="coerce")
+    missing_categories = [category for category in categories if category not in df.columns]
+    if missing_categories:
+        df = df.assign(**{category: np.nan for category in missing_categories})
+
+    category_columns = list(categories)
+    df[category_columns] = df[category_columns].apply(pd.to_numeric, errors="coerce")
 
     return df[["name", *categories]]
 
@@ -141,30 +208,89 @@ def calculate_z_scores(
     negative_categories: Iterable[str] = BATTER_NEGATIVE_CATEGORIES,
 ) -> pd.DataFrame:
     """Calculate per-category z-scores for all players."""
-    category_frame = stats_df.loc[:, categories].copy()
+    values = stats_df.loc[:, categories].to_numpy(dtype=np.float64)
+
+    with warnings.catch_warnings():
+        # Categories with no observed values produce NaN stats and score 0 below.
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        means = np.nanmean(values, axis=0)
+        stds = np.nanstd(values, axis=0)
+
+    # Missing values are imputed with the category mean, so they center to exactly 0.
+    centered = values - means
+    np.copyto(centered, 0.0, where=np.isnan(values))
+    safe_stds = np.where(stds == 0, np.nan, stds)
+
+    negative_set = frozenset(negative_categories)
+    signs = np.array([-1.0 if category in negative_set else 1.0 for category in categories])
+    z_values = signs * centered / safe_stds
+    z_values[np.isnan(z_values)] = 0.0
+
+    return pd.DataFrame(
+        z_values,
+        index=stats_df.index,
+        columns=_z_score_columns(categories),
+    )
 
-    means = category_frame.mean(axis=0, skipna=True)
-    stds = category_frame.std(axis=0, skipna=True, ddof=0)
 
-    centered = category_frame.fillna(means).sub(means, axis=1)
-    safe_stds = stds.replace(0, np.nan)
-    z_scores = centered.div(safe_stds, axis=1).fillna(0.0)
+@functools.lru_cache(maxsize=8)
+def _weight_vector(
+    categories: tuple[str, ...],
+    weights_key: tuple[tuple[str, float], ...],
+) -> np.ndarray:
+    """Build a read-only weight vector in category order, defaulting to 1.0."""
+    weight_map = dict(weights_key)
+    vector = np.fromiter(
+        (float(weight_map.get(category, 1.0)) for category in categories),
+        dtype=np.float64,
+        count=len(categories),
+    )
+    vector.flags.writeable = False
+    return vector
 
-    for category in negative_categories:
-        if category in z_scores.columns:
-            z_scores[category] = -1.0 * z_scores[category]
 
-    return z_scores.add_prefix("z_")
+def resolve_weight_vector(
+    weights: Mapping[str, float] | None,
+    categories: Sequence[str] = BATTER_CATEGORIES,
+) -> np.ndarray:
+    """Return the cached weight vector for the categories (unlisted weights are 1.0)."""
+    weights_key = tuple(sorted(weights.items())) if weights else ()
+    return _weight_vector(tuple(categories), weights_key)
 
 
-def _resolve_weights(
-    weights: Mapping[str, float] | None,
+def weighted_z_score_total(
+    z_scores: pd.DataFrame,
+    weights: Mapping[str, float] | None = None,
     categories: Sequence[str] = BATTER_CATEGORIES,
-) -> dict[str, float]:
-    """Validate and return a complete weight map for all categories."""
-    if weights is None:
-        return default_weights_for_categories(categories)
-    return {category: float(weights.get(category, 1.0)) for category in categories}
+) -> pd.Series:
+    """Return each player's weighted sum of category z-scores as one dot product."""
+    weight_vector = resolve_weight_vector(weights, categories=categories)
+    z_matrix = z_scores.loc[:, _z_score_columns(categories)].to_numpy(dtype=np.float64)
+    if np.all(weight_vector == 1.0):
+        # Equal weights (the default) reduce to a plain row sum.
+        return pd.Series(z_matrix.sum(axis=1), index=z_scores.index)
+    return pd.Series(z_matrix @ weight_vector, index=z_scores.index)
+
+
+def descending_rank_order(scores: np.ndarray, top_k: int | None = None) -> np.ndarray:
+    """Return row positions by descending score, keeping only the first top_k.
+
+    Ties keep their input order, matching a stable descending sort. With
+    top_k set, only rows at or above the k-th best score are sorted.
+    """
+    descending = -np.asarray(scores, dtype=np.float64)
+    if top_k is None or top_k >= len(descending):
+        return np.argsort(descending, kind="stable")
+    if top_k <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    kth_value = np.partition(descending, top_k - 1)[top_k - 1]
+    if np.isnan(kth_value):
+        return np.argsort(descending, kind="stable")[:top_k]
+
+    candidates = np.flatnonzero(descending <= kth_value)
+    ordered = candidates[np.argsort(descending[candidates], kind="stable")]
+    return ordered[:top_k]
 
 
 def score_and_rank_players(
@@ -172,8 +298,12 @@ def score_and_rank_players(
     weights: Mapping[str, float] | None = None,
     categories: Sequence[str] = BATTER_CATEGORIES,
     negative_categories: Iterable[str] = BATTER_NEGATIVE_CATEGORIES,
+    top_k: int | None = None,
 ) -> pd.DataFrame:
-    """Score and rank players using weighted category z-scores."""
+    """Score and rank players using weighted category z-scores.
+
+    Pass top_k to return only the best top_k players.
+    """
     df = _coerce_player_dataframe(player_records, categories=categories)
     z_scores = calculate_z_scores(
         df,
@@ -181,13 +311,13 @@ def score_and_rank_players(
         negative_categories=negative_categories,
     )
 
-    effective_weights = _resolve_weights(weights, categories=categories)
-    weighted_total = pd.Series(0.0, index=df.index)
-    for category in categories:
-        weighted_total += z_scores[f"z_{category}"] * effective_weights[category]
+    weighted_total = weighted_z_score_total(z_scores, weights, categories=categories)
 
     ranked = pd.concat([df[["name"]], z_scores], axis=1)
     ranked["overall_score"] = weighted_total
+    if top_k is not None:
+        order = descending_rank_order(weighted_total.to_numpy(), top_k=top_k)
+        return ranked.iloc[order].reset_index(drop=True)
     return ranked.sort_values("overall_score", ascending=False, kind="mergesort").reset_index(drop=True)
 
 
@@ -196,6 +326,7 @@ def rank_players_from_json(
     weights: Mapping[str, float] | None = None,
     categories: Sequence[str] = BATTER_CATEGORIES,
     negative_categories: Iterable[str] = BATTER_NEGATIVE_CATEGORIES,
+    top_k: int | None = None,
 ) -> pd.DataFrame:
     """Load JSON player records and return ranked rows."""
     records = load_players_from_json(json_path)
@@ -204,6 +335,7 @@ def rank_players_from_json(
         weights=weights,
         categories=categories,
         negative_categories=negative_categories,
+        top_k=top_k,
     )
 
 
@@ -250,7 +382,7 @@ if __name__ == "__main__":
         negative_categories=BATTER_NEGATIVE_CATEGORIES,
     )
 
-    display_columns = ["name", "overall_score", *[f"z_{category}" for category in BATTER_CATEGORIES]]
+    display_columns = ["name", "overall_score", *BATTER_Z_COLUMNS]
     pd.set_option("display.width", 200)
     pd.set_option("display.max_columns", None)
 
@@ -9,8 +9,8 @@ Supports three modes:
 from __future__ import annotations
 
 import argparse
-import json
 import re
+import string
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Mapping, Sequence
@@ -22,19 +22,24 @@ from hitter_category_ranker import (
     BATTER_CATEGORIES,
     BATTER_NEGATIVE_CATEGORIES,
     COMBINED_CATEGORIES,
-    COMBINED_PITCHER_CATEGORIES,
     COMBINED_NEGATIVE_CATEGORIES,
     PITCHER_CATEGORIES,
     PITCHER_NEGATIVE_CATEGORIES,
     PITCHER_PREFIX,
     calculate_z_scores,
-    default_weights_for_categories,
+    descending_rank_order,
+    read_json_payload,
+    weighted_z_score_total,
+    write_json_records,
 )
 
 TEAM_POSITION_PATTERN = re.compile(r"^(?P<team>[A-Z]{2,4})\s*-\s*(?P<position>[A-Za-z0-9,/]+)\b")
 NUMBER_PATTERN = re.compile(r"^[+-]?(?:\d+(?:\.\d+)?|\.\d+)$")
 PERCENT_PATTERN = re.compile(r"^[+-]?(?:\d+(?:\.\d+)?|\.\d+)%$")
 
+ASCII_LETTERS = frozenset(string.ascii_letters)
+UPPERCASE_LETTERS = frozenset(string.ascii_uppercase)
+
 NOTE_MARKERS = (
     "No new player Notes",
     "No new Player Notes",
@@ -62,7 +67,9 @@ NON_NAME_VALUES = frozenset(
 )
 
 ALL_BASE_CATEGORIES: tuple[str, ...] = tuple(dict.fromkeys((*BATTER_CATEGORIES, *PITCHER_CATEGORIES)))
+IDENTITY_FIELDS: tuple[str, ...] = ("name", "team", "position", "player_type")
 PLAYER_TYPES = ("batter", "pitcher")
+PARQUET_SUFFIXES = frozenset({".parquet", ".pq"})
 
 
 @dataclass(frozen=True)
@@ -146,13 +153,11 @@ def _looks_like_name(candidate: str) -> bool:
         return False
     if candidate in NON_NAME_VALUES:
         return False
-    if TEAM_POSITION_PATTERN.match(candidate):
-        return False
-    if NUMBER_PATTERN.match(candidate):
+    # Team lines always start with an uppercase letter; plain numbers and
+    # percentages contain no letters, so the final check rejects them.
+    if candidate[0] in UPPERCASE_LETTERS and TEAM_POSITION_PATTERN.match(candidate):
         return False
-    if PERCENT_PATTERN.match(candidate):
-        return False
-    return bool(re.search(r"[A-Za-z]", candidate))
+    return not ASCII_LETTERS.isdisjoint(candidate)
 
 
 def _extract_player_name(lines: Sequence[str], team_line_index: int) -> str:
@@ -166,11 +171,15 @@ def _extract_player_name(lines: Sequence[str], team_line_index: int) -> str:
     return "Unknown Player"
 
 
-def _find_next_team_line_index(lines: Sequence[str], start_index: int) -> int:
-    for idx in range(start_index, len(lines)):
-        if TEAM_POSITION_PATTERN.match(lines[idx]):
-            return idx
-    return len(lines)
+def _scan_team_lines(lines: Sequence[str]) -> list[tuple[int, re.Match[str]]]:
+    team_lines: list[tuple[int, re.Match[str]]] = []
+    for idx, line in enumerate(lines):
+        if line[0] not in UPPERCASE_LETTERS:
+            continue
+        match = TEAM_POSITION_PATTERN.match(line)
+        if match:
+            team_lines.append((idx, match))
+    return team_lines
 
 
 def _extract_numeric_values_in_player_block(
@@ -215,14 +224,11 @@ def parse_yahoo_copy_paste(
     lines = _normalize_lines(raw_text)
     parsed_records: list[dict[str, Any]] = []
 
-    for idx, line in enumerate(lines):
-        match = TEAM_POSITION_PATTERN.match(line)
-        if not match:
-            continue
-
-        row_end_index = _find_next_team_line_index(lines, idx + 1)
-        numeric_values = _extract_numeric_values_in_player_block(lines, idx + 1, row_end_index)
+    # Classify team/position lines once; each player block runs up to the next one.
+    team_lines = _scan_team_lines(lines)
+    block_end_indices = [idx for idx, _ in team_lines[1:]] + [len(lines)]
 
+    for (idx, match), row_end_index in zip(team_lines, block_end_indices):
         position = match.group("position")
         detected_type = infer_player_type(position)
 
@@ -231,6 +237,7 @@ def parse_yahoo_copy_paste(
         if normalized_mode == "pitchers" and detected_type != "pitcher":
             continue
 
+        numeric_values = _extract_numeric_values_in_player_block(lines, idx + 1, row_end_index)
         row_categories = BATTER_CATEGORIES if detected_type == "batter" else PITCHER_CATEGORIES
         stat_map = _map_values_to_categories(numeric_values, row_categories)
 
@@ -246,35 +253,41 @@ def parse_yahoo_copy_paste(
     return parsed_records
 
 
-def _player_identity_key(record: Mapping[str, Any]) -> tuple[str, str, str, str]:
-    name = str(record.get("name", "")).strip().lower()
-    team = str(record.get("team", "")).strip().upper()
-    position = str(record.get("position", "")).strip().upper()
-    player_type = str(record.get("player_type", "")).strip().lower()
-    if player_type not in PLAYER_TYPES:
-        player_type = infer_player_type(position)
-    return (name, team, position, player_type)
-
-
-def _sanitize_record_for_database(record: Mapping[str, Any]) -> dict[str, Any]:
+def _sanitize_identity_fields(record: Mapping[str, Any]) -> dict[str, Any]:
     raw_name = str(record.get("name", "Unknown Player")).replace("\ufeff", "")
     position = str(record.get("position", "NA")).strip().upper()
     player_type = str(record.get("player_type", "")).strip().lower()
     if player_type not in PLAYER_TYPES:
         player_type = infer_player_type(position)
 
-    cleaned: dict[str, Any] = {
+    return {
         "name": raw_name.strip(),
         "team": str(record.get("team", "NA")).strip().upper(),
         "position": position,
         "player_type": player_type,
     }
 
-    for category in ALL_BASE_CATEGORIES:
-        value = pd.to_numeric(record.get(category), errors="coerce")
-        cleaned[category] = float(value) if pd.notna(value) else np.nan
 
-    return cleaned
+def _coerce_stat_columns(records: Sequence[Mapping[str, Any]]) -> np.ndarray:
+    # Gather each stat column separately so pandas never infers dtypes row by row.
+    raw_columns = {category: [record.get(category) for record in records] for category in ALL_BASE_CATEGORIES}
+    return (
+        pd.DataFrame(raw_columns, columns=list(ALL_BASE_CATEGORIES))
+        .apply(pd.to_numeric, errors="coerce")
+        .to_numpy(dtype=np.float64)
+    )
+
+
+def _sanitize_records_for_database(records: Sequence[Mapping[str, Any]]) -> list[dict[str, Any]]:
+    if not records:
+        return []
+
+    cleaned_records: list[dict[str, Any]] = []
+    for record, values in zip(records, _coerce_stat_columns(records).tolist()):
+        cleaned = _sanitize_identity_fields(record)
+        cleaned.update(zip(ALL_BASE_CATEGORIES, values))
+        cleaned_records.append(cleaned)
+    return cleaned_records
 
 
 def load_records_json(json_path: str | Path) -> list[dict[str, Any]]:
@@ -282,64 +295,75 @@ def load_records_json(json_path: str | Path) -> list[dict[str, Any]]:
     if not path.exists():
         return []
 
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload = read_json_payload(path)
     if not isinstance(payload, list):
         return []
 
-    records: list[dict[str, Any]] = []
-    for item in payload:
-        if isinstance(item, dict):
-            records.append(_sanitize_record_for_database(item))
-    return records
+    return _sanitize_records_for_database([item for item in payload if isinstance(item, dict)])
+
+
+def load_records_parquet(parquet_path: str | Path) -> list[dict[str, Any]]:
+    path = Path(parquet_path)
+    if not path.exists():
+        return []
+
+    frame = pd.read_parquet(path)
+    return _sanitize_records_for_database(frame.to_dict(orient="records"))
+
+
+def load_database_records(db_path: str | Path) -> list[dict[str, Any]]:
+    if Path(db_path).suffix.lower() in PARQUET_SUFFIXES:
+        return load_records_parquet(db_path)
+    return load_records_json(db_path)
 
 
 def merge_player_records(
     existing_records: Sequence[Mapping[str, Any]],
     incoming_records: Sequence[Mapping[str, Any]],
 ) -> list[dict[str, Any]]:
-    merged: dict[tuple[str, str, str, str], dict[str, Any]] = {}
-
-    for record in existing_records:
-        cleaned = _sanitize_record_for_database(record)
-        merged[_player_identity_key(cleaned)] = cleaned
+    cleaned_records = _sanitize_records_for_database([*existing_records, *incoming_records])
+    if not cleaned_records:
+        return []
 
-    for record in incoming_records:
-        cleaned = _sanitize_record_for_database(record)
-        merged[_player_identity_key(cleaned)] = cleaned
+    identity_keys = pd.DataFrame(cleaned_records, columns=list(IDENTITY_FIELDS))
+    identity_keys["name"] = identity_keys["name"].str.lower()
 
-    return list(merged.values())
+    # Later records win, but each player keeps the position of its first appearance.
+    first_seen_order = identity_keys.groupby(list(IDENTITY_FIELDS), sort=False).ngroup().to_numpy()
+    kept_positions = np.flatnonzero(~identity_keys.duplicated(keep="last").to_numpy())
+    kept_positions = kept_positions[np.argsort(first_seen_order[kept_positions], kind="stable")]
+    return [cleaned_records[position] for position in kept_positions]
 
 
 def write_records_json(records: Sequence[Mapping[str, Any]], output_path: str | Path) -> None:
-    json_ready: list[dict[str, Any]] = []
-    for record in records:
-        cleaned_record: dict[str, Any] = {}
-        for key, value in record.items():
-            if isinstance(value, (float, np.floating)) and np.isnan(value):
-                cleaned_record[key] = None
-            elif isinstance(value, np.floating):
-                cleaned_record[key] = float(value)
-            elif isinstance(value, np.integer):
-                cleaned_record[key] = int(value)
-            else:
-                cleaned_record[key] = value
-        json_ready.append(cleaned_record)
+    write_json_records(records, output_path)
 
-    path = Path(output_path)
-    path.write_text(json.dumps(json_ready, indent=2, ensure_ascii=False), encoding="utf-8")
 
+def write_records_parquet(records: Sequence[Mapping[str, Any]], output_path: str | Path) -> None:
+    frame = pd.DataFrame([dict(record) for record in records], columns=[*IDENTITY_FIELDS, *ALL_BASE_CATEGORIES])
+    frame[list(ALL_BASE_CATEGORIES)] = frame[list(ALL_BASE_CATEGORIES)].astype(np.float64)
+    frame.to_parquet(Path(output_path), index=False)
+
+
+def write_database_records(records: Sequence[Mapping[str, Any]], db_path: str | Path) -> None:
+    if Path(db_path).suffix.lower() in PARQUET_SUFFIXES:
+        write_records_parquet(records, db_path)
+    else:
+        write_records_json(records, db_path)
 
-def _scale_scores_to_100(raw_scores: pd.Series) -> pd.Series:
-    min_score = raw_scores.min(skipna=True)
-    max_score = raw_scores.max(skipna=True)
 
-    if pd.isna(min_score) or pd.isna(max_score):
+def _scale_scores_to_100(raw_scores: pd.Series) -> pd.Series:
+    values = raw_scores.to_numpy(dtype=np.float64)
+    if values.size == 0 or np.isnan(values).all():
         return pd.Series(50.0, index=raw_scores.index)
 
+    min_score = np.nanmin(values)
+    max_score = np.nanmax(values)
     if np.isclose(max_score, min_score):
         return pd.Series(50.0, index=raw_scores.index)
 
-    return ((raw_scores - min_score) / (max_score - min_score)) * 100.0
+    scale = 100.0 / (max_score - min_score)
+    return pd.Series((values - min_score) * scale, index=raw_scores.index)
 
 
 def _replacement_cutoffs(config: CombinedRankingConfig) -> dict[str, int]:
@@ -355,7 +379,7 @@ def _replacement_score_for_type(
     score_column: str,
     cutoff_rank: int,
 ) -> float:
-    subset = records_df.loc[records_df["player_type"] == player_type, [score_column]].copy()
+    subset = records_df.loc[records_df["player_type"] == player_type, [score_column]]
     if subset.empty:
         return 0.0
 
@@ -420,61 +444,38 @@ def _apply_combined_adjustments(
     return adjusted
 
 
-def _resolve_weights(
-    categories: Sequence[str],
-    weights: Mapping[str, float] | None = None,
-) -> dict[str, float]:
-    resolved = default_weights_for_categories(categories)
-    if not weights:
-        return resolved
-    for category, value in weights.items():
-        if category in resolved:
-            resolved[category] = float(value)
-    return resolved
-
-
 def _records_for_mode(
     records: Sequence[Mapping[str, Any]],
     mode: str,
 ) -> list[dict[str, Any]]:
     normalized_mode = _normalize_mode(mode)
+    cleaned_records = _sanitize_records_for_database(records)
     if normalized_mode == "combined":
-        return [_sanitize_record_for_database(record) for record in records]
+        return cleaned_records
 
     wanted_type = "pitcher" if normalized_mode == "pitchers" else "batter"
-    filtered = []
-    for record in records:
-        cleaned = _sanitize_record_for_database(record)
-        if cleaned.get("player_type") == wanted_type:
-            filtered.append(cleaned)
-    return filtered
+    return [cleaned for cleaned in cleaned_records if cleaned.get("player_type") == wanted_type]
 
 
-def _prepare_records_for_scoring(
+def _prepare_scoring_frame(
     records: Sequence[Mapping[str, Any]],
     mode: str,
-) -> list[dict[str, Any]]:
+) -> pd.DataFrame:
     normalized_mode = _normalize_mode(mode)
-    prepared: list[dict[str, Any]] = []
+    identity_rows = [_sanitize_identity_fields(record) for record in records]
+    stat_values = _coerce_stat_columns(records)
 
-    for raw_record in records:
-        record = _sanitize_record_for_database(raw_record)
-        if normalized_mode != "combined":
-            prepared.append(record)
-            continue
+    columns: dict[str, Any] = {field: [row[field] for row in identity_rows] for field in IDENTITY_FIELDS}
+    columns.update(zip(ALL_BASE_CATEGORIES, stat_values.T))
 
-        expanded = dict(record)
-        if record.get("player_type") == "pitcher":
-            for category in BATTER_CATEGORIES:
-                expanded[category] = np.nan
-            for category in PITCHER_CATEGORIES:
-                expanded[f"{PITCHER_PREFIX}{category}"] = record.get(category, np.nan)
-        else:
-            for category in COMBINED_PITCHER_CATEGORIES:
-                expanded[category] = np.nan
-        prepared.append(expanded)
+    if normalized_mode == "combined":
+        is_pitcher = np.array([row["player_type"] == "pitcher" for row in identity_rows], dtype=bool)
+        for category in PITCHER_CATEGORIES:
+            columns[f"{PITCHER_PREFIX}{category}"] = np.where(is_pitcher, columns[category], np.nan)
+        for category in BATTER_CATEGORIES:
+            columns[category] = np.where(is_pitcher, np.nan, columns[category])
 
-    return prepared
+    return pd.DataFrame(columns)
 
 
 def _position_tokens(position: Any) -> list[str]:
@@ -502,6 +503,7 @@ def add_overall_scores(
     weights: Mapping[str, float] | None = None,
     include_z_scores: bool = False,
     combined_config: CombinedRankingConfig | None = None,
+    top_k: int | None = None,
 ) -> list[dict[str, Any]]:
     if not records:
         return []
@@ -509,18 +511,9 @@ def add_overall_scores(
     normalized_mode = _normalize_mode(mode)
     categories = _categories_for_mode(normalized_mode)
     negative_categories = _negative_categories_for_mode(normalized_mode)
-    scoring_records = _prepare_records_for_scoring(records, normalized_mode)
-
-    df = pd.DataFrame(scoring_records).copy()
-    if "player_type" not in df.columns:
-        position_series = df["position"] if "position" in df.columns else pd.Series("", index=df.index)
-        df["player_type"] = position_series.map(infer_player_type)
-    df["player_type"] = (
-        df["player_type"]
-        .fillna("batter")
-        .astype(str)
-        .str.lower()
-    )
+    # Sanitized frames already carry a normalized player_type, float64 stat
+    # columns and, in combined mode, the per-type category masks.
+    df = _prepare_scoring_frame(records, normalized_mode)
 
     # Safety filter: mode-specific pools should never mix player types.
     if normalized_mode == "batters":
@@ -528,39 +521,17 @@ def add_overall_scores(
     elif normalized_mode == "pitchers":
         df = df.loc[df["player_type"] == "pitcher"].reset_index(drop=True)
 
-    # In combined mode, isolate category pools by player type.
-    if normalized_mode == "combined":
-        pitcher_mask = df["player_type"] == "pitcher"
-        for category in BATTER_CATEGORIES:
-            if category not in df.columns:
-                df[category] = np.nan
-            df.loc[pitcher_mask, category] = np.nan
-        for category in COMBINED_PITCHER_CATEGORIES:
-            if category not in df.columns:
-                df[category] = np.nan
-            df.loc[~pitcher_mask, category] = np.nan
+    is_pitcher = df["player_type"] == "pitcher"
 
-    for category in categories:
-        if category not in df.columns:
-            df[category] = np.nan
-        df[category] = pd.to_numeric(df[category], errors="coerce")
-
-    score_frame = df[["name", *categories]].copy()
     z_scores = calculate_z_scores(
-        score_frame,
+        df,
         categories=categories,
         negative_categories=negative_categories,
     )
 
-    player_type_series = (
-        df.get("player_type", pd.Series("batter", index=df.index))
-        .fillna("batter")
-        .astype(str)
-        .str.lower()
-    )
     position_series = df.get("position", pd.Series("", index=df.index))
-    is_pitcher = player_type_series == "pitcher"
-    is_starting_pitcher = position_series.map(_position_tokens).map(lambda tokens: "SP" in tokens) & is_pitcher
+    is_starting_position = position_series.map(lambda position: "SP" in _position_tokens(position)).astype(bool)
+    is_starting_pitcher = is_starting_position & is_pitcher
 
     ip_category = _mode_pitcher_category_key("IP", normalized_mode)
     sv_category = _mode_pitcher_category_key("SV", normalized_mode)
@@ -577,12 +548,9 @@ def add_overall_scores(
     if hld_col in z_scores.columns:
         z_scores.loc[is_starting_pitcher, hld_col] = 0.0
 
-    resolved_weights = _resolve_weights(categories=categories, weights=weights)
-    weighted_total = pd.Series(0.0, index=df.index)
-    for category in categories:
-        weighted_total += z_scores[f"z_{category}"] * resolved_weights[category]
+    weighted_total = weighted_z_score_total(z_scores, weights, categories=categories)
 
-    scored = df.copy()
+    scored = df
     scored["z_score_total"] = weighted_total
 
     ranking_metric = scored["z_score_total"]
@@ -597,7 +565,11 @@ def add_overall_scores(
     if include_z_scores:
         scored = pd.concat([scored, z_scores], axis=1)
 
-    scored = scored.sort_values("overall_score", ascending=False, kind="mergesort").reset_index(drop=True)
+    if top_k is not None:
+        order = descending_rank_order(scored["overall_score"].to_numpy(), top_k=top_k)
+        scored = scored.iloc[order].reset_index(drop=True)
+    else:
+        scored = scored.sort_values("overall_score", ascending=False, kind="mergesort").reset_index(drop=True)
     return scored.to_dict(orient="records")
 
 
@@ -611,7 +583,7 @@ def build_category_leaderboards(
 
     categories = _categories_for_mode(mode)
     negative_categories = _negative_categories_for_mode(mode)
-    df = pd.DataFrame(records).copy()
+    df = pd.DataFrame(records)
     leaders: dict[str, list[dict[str, Any]]] = {}
 
     for category in categories:
@@ -716,7 +688,7 @@ def _run_scoring_pipeline(
 
 
 def _run_interactive_mode(args: argparse.Namespace) -> None:
-    database_records = load_records_json(args.db)
+    database_records = load_database_records(args.db)
     if database_records:
         print(f"Loaded existing database: {args.db} ({len(database_records)} players)")
     else:
@@ -732,7 +704,7 @@ def _run_interactive_mode(args: argparse.Namespace) -> None:
 
             if parsed_records:
                 database_records = merge_player_records(database_records, parsed_records)
-                write_records_json(database_records, args.db)
+                write_database_records(database_records, args.db)
                 print(f"Database updated: {args.db} ({len(database_records)} unique players)")
 
                 mode_records = _records_for_mode(database_records, mode=args.mode)
@@ -794,7 +766,7 @@ def _build_arg_parser() -> argparse.ArgumentParser:
         "--db",
         type=str,
         default="players_database.json",
-        help="Master database JSON path used with --update-db.",
+        help="Master database path used with --update-db (.json, or .parquet to store it as Parquet).",
     )
     parser.add_argument(
         "--update-db",
@@ -821,9 +793,9 @@ def main() -> None:
     parsed_records = parse_yahoo_copy_paste(raw_text, mode=args.mode)
 
     if args.update_db:
-        existing_records = load_records_json(args.db)
+        existing_records = load_database_records(args.db)
         merged_records = merge_player_records(existing_records, parsed_records)
-        write_records_json(merged_records, args.db)
+        write_database_records(merged_records, args.db)
         source_records = _records_for_mode(merged_records, mode=args.mode)
     else:
         source_records = _records_for_mode(parsed_records, mode=args.mode)